@@ -1,5 +1,7 @@
-import math
-import pandas as pd
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
 import streamlit as st
 
 st.set_page_config(page_title="CEVA / NovaXpress Tariff Calculator", page_icon="📦", layout="centered")
@@ -8,6 +10,8 @@ st.set_page_config(page_title="CEVA / NovaXpress Tariff Calculator", page_icon="
 ZONES = [(1, 0, 50), (2, 51, 150), (3, 151, 300), (4, 301, 400), (5, 401, 500)]
 MIN_CHARGE = {1:30.00, 2:45.00, 3:60.00, 4:70.00, 5:80.00}
 # rows = weight brackets, cols = zone1..zone5
+# Kept as the human-readable source of truth; the hot path uses the flat
+# arrays derived below (_RATE_MATRIX et al.), never this dict.
 RATES = {
     "0-500":     (500,  [0.064, 0.120, 0.167, 0.224, 0.261]),
     "501-1000":  (1000, [0.054, 0.083, 0.111, 0.158, 0.186]),
@@ -27,89 +31,262 @@ ACCESSORIALS = {
 WAIT_RATE_HR = 45.0                    # billed in 15-min increments after first 30 min free
 FUEL_DEFAULT = 0.15                    # 15%
 
+# Precomputed lookup tables (built once per worker) so the per-call helpers are
+# a binary search + index instead of a branch cascade / dict scan.
+_ZONE_UPPERS = (50, 150, 300, 400, 500)
+_BRK_UPPERS = (500, 1000, 2000, 4000)
+_BRK_NAMES = ("0-500", "501-1000", "1001-2000", "2001-4000", "4001+")
+_ACC_NAMES = tuple(ACCESSORIALS)  # fixed order; direct drive is last
+_MIN_BY_ZONE = (None,) + tuple(MIN_CHARGE[z] for z in range(1, 6))  # index by zone number
+_OOA_TYPES = tuple(OOA_RATE)
+_OOA_BY_IDX = tuple(OOA_RATE.values())
+
+@st.cache_resource
+def _tariff_tables():
+    """Derived ndarray tariff tables, built exactly once per worker process."""
+    return dict(
+        # rows = weight brackets (same order as _BRK_NAMES), cols = zone1..zone5
+        rate=np.array([zrates for (_, zrates) in RATES.values()], dtype=np.float64),
+        minc=np.array([MIN_CHARGE[z] for z in range(1, 6)], dtype=np.float64),
+        acc=np.array(list(ACCESSORIALS.values()), dtype=np.float64),
+        zones=np.array(_ZONE_UPPERS, dtype=np.float64),
+        brk=np.array(_BRK_UPPERS, dtype=np.float64),
+        ooa=np.array(list(OOA_RATE.values()), dtype=np.float64),
+    )
+
+_T = _tariff_tables()
+_RATE_MATRIX, _MIN_CHARGE_ARR, _ACC_COSTS = _T["rate"], _T["minc"], _T["acc"]
+_ZONE_UPPERS_ARR, _BRK_UPPERS_ARR, _OOA_RATE_ARR = _T["zones"], _T["brk"], _T["ooa"]
+del _T
+# (bit, cost) pairs for testing an accessorial bitmask, _ACC_NAMES order
+_ACC_BITS = tuple((1 << i, float(c)) for i, c in enumerate(_ACC_COSTS))
+# Breakdown table: display labels and the breakdown keys they read from
+_COMPONENTS = ("Base LTL", "Out-of-Area charge", "Accessorials (non-fuel)",
+               "Wait Time charge", "Extra Stops amount", "Fuel amount")
+_COMPONENT_KEYS = ("Base LTL", "OOA charge", "Accessorials (non-fuel)",
+                   "Wait Time charge", "Extra Stops amount", "Fuel amount")
+# Column order of the example-scenarios table
+_SCENARIO_COLS = ("Scenario", "Zone", "Weight Bracket", "Rate per lb", "Base LTL",
+                  "OOA charge", "Accessorials (non-fuel)", "Wait Time charge",
+                  "Extra Stops amount", "Fuelable Subtotal", "Fuel % used",
+                  "Fuel amount", "Grand Total")
+
 # ---------------------- HELPERS ----------------------
 def zone_from_km(km: float):
-    if km <= 50: return 1
-    if km <= 150: return 2
-    if km <= 300: return 3
-    if km <= 400: return 4
-    if km <= 500: return 5
-    return None
+    i = bisect_left(_ZONE_UPPERS, km)
+    return None if i == 5 else i + 1
 
 def bracket_and_rate(weight_lbs: float, zone: int):
-    for name, (upper, zrates) in RATES.items():
-        if weight_lbs <= upper:
-            return name, zrates[zone-1]
-    # should never hit because last bracket is inf
-    return "4001+", RATES["4001+"][1][zone-1]
+    i = bisect_left(_BRK_UPPERS, weight_lbs)
+    return _BRK_NAMES[i], float(_RATE_MATRIX[i, zone-1])
 
-def ceil_div(a, b):  # ceil(a/b)
-    return math.ceil(a / b)
+def ceil_div(a, b):  # ceil(a/b) for positive ints, pure integer arithmetic
+    return -(-a // b)
 
-def calculate(
-    distance_km, weight_lbs, 
-    is_ooa, ooa_type, ooa_km,
-    flags, wait_minutes, extra_stops,
+_BREAKDOWN_KEYS = (
+    "Zone", "Weight Bracket", "Rate per lb", "Base LTL", "OOA charge",
+    "Accessorials (non-fuel)", "Wait Time charge", "Extra Stops amount",
+    "Fuelable Subtotal", "Fuel % used", "Fuel amount", "Grand Total",
+)
+
+@lru_cache(maxsize=256)
+def _calculate_cached(
+    distance_km, weight_lbs,
+    is_ooa, ooa_type_idx, ooa_km,
+    flag_bits, wait_minutes, extra_stops,
     apply_fuel, fuel_pct_override  # override as percent (e.g., 12) or None
 ):
+    """Core tariff math; all args hashable so repeat reruns hit the cache.
+
+    flag_bits packs the accessorials in _ACC_NAMES order. Returns the
+    breakdown values as a tuple (order = _BREAKDOWN_KEYS), or None if the
+    distance falls outside the tariff's zones.
+    """
     zone = zone_from_km(distance_km)
     if zone is None:
-        return {"error": "Distance exceeds Zone 5 (500 km) supported by this tariff."}
+        return None
 
     bracket, rate_per_lb = bracket_and_rate(weight_lbs, zone)
-    base = max(MIN_CHARGE[zone], rate_per_lb * weight_lbs)
+    base = max(_MIN_BY_ZONE[zone], rate_per_lb * weight_lbs)
+
+    # Fast path: no OOA/accessorials/wait/extra stops reduces to base + fuel
+    if not is_ooa and flag_bits == 0 and wait_minutes <= 30 and extra_stops == 0:
+        fuel_pct = 0.0 if not apply_fuel else (
+            FUEL_DEFAULT if fuel_pct_override is None else max(0.0, fuel_pct_override * 0.01)
+        )
+        fuel_amt = base * fuel_pct
+        base_r = round(base, 2)
+        return (zone, bracket, rate_per_lb, base_r, 0.0, 0.0, 0.0, 0.0, base_r,
+                fuel_pct, round(fuel_amt, 2), round(base + fuel_amt, 2))
 
     # Out-of-area
     ooa_charge = 0.0
     if is_ooa and ooa_km > 0:
-        ooa_charge = OOA_RATE[ooa_type] * ooa_km
+        ooa_charge = _OOA_BY_IDX[ooa_type_idx] * ooa_km
 
-    # Accessorials (non-fuel) – all flat items add here
+    # Accessorials (non-fuel) – bit-test against the precomputed (bit, cost) pairs
     acc = 0.0
-    for k, v in ACCESSORIALS.items():
-        if flags.get(k, False):
-            acc += v
+    for bit, cost in _ACC_BITS:
+        if flag_bits & bit:
+            acc += cost
 
-    # Wait time: first 30 min free, then 15-min increments
-    wait_charge = 0.0
-    if wait_minutes > 30:
-        increments = ceil_div(wait_minutes - 30, 15)
-        wait_charge = (WAIT_RATE_HR / 4.0) * increments
-        acc += wait_charge
+    # Wait time: first 30 min free, then 15-min increments (branchless integer ceil)
+    inc = (wait_minutes - 30 + 14) // 15
+    inc = inc if inc > 0 else 0
+    wait_charge = (WAIT_RATE_HR / 4.0) * inc
+    acc += wait_charge
 
     # Extra stops at base rate
     extra_amt = base * max(0, int(extra_stops))
 
     # Fuelable = Base + OOA + Direct Drive (flat if enabled) + Extra stops
-    direct_drive_flat = ACCESSORIALS["Direct Drive (flat)"] if flags.get("Direct Drive (flat)", False) else 0.0
+    direct_drive_flat = float(_ACC_COSTS[5]) if flag_bits & 32 else 0.0
     fuelable = base + ooa_charge + direct_drive_flat + extra_amt
 
-    # Fuel percent (decimal)
-    fuel_pct = 0.0
-    if apply_fuel:
-        if fuel_pct_override is None:
-            fuel_pct = FUEL_DEFAULT
-        else:
-            fuel_pct = max(0.0, float(fuel_pct_override) / 100.0)
+    # Fuel percent (decimal); override arrives as a float percent from the widget
+    fuel_pct = 0.0 if not apply_fuel else (
+        FUEL_DEFAULT if fuel_pct_override is None else max(0.0, fuel_pct_override * 0.01)
+    )
 
     fuel_amt = fuelable * fuel_pct
     total = base + ooa_charge + acc + extra_amt + fuel_amt
 
-    breakdown = {
-        "Zone": zone,
-        "Weight Bracket": bracket,
-        "Rate per lb": rate_per_lb,
-        "Base LTL": round(base, 2),
-        "OOA charge": round(ooa_charge, 2),
-        "Accessorials (non-fuel)": round(acc - wait_charge, 2),
-        "Wait Time charge": round(wait_charge, 2),
-        "Extra Stops amount": round(extra_amt, 2),
-        "Fuelable Subtotal": round(fuelable, 2),
-        "Fuel % used": fuel_pct,
-        "Fuel amount": round(fuel_amt, 2),
-        "Grand Total": round(total, 2),
-    }
-    return breakdown
+    # Builtin round(): np.round's scale/round/unscale drifts a cent on
+    # half-cent-boundary doubles, and the fast path above rounds this way too
+    return (
+        zone,
+        bracket,
+        rate_per_lb,
+        round(base, 2),
+        round(ooa_charge, 2),
+        round(acc - wait_charge, 2),
+        round(wait_charge, 2),
+        round(extra_amt, 2),
+        round(fuelable, 2),
+        fuel_pct,
+        round(fuel_amt, 2),
+        round(total, 2),
+    )
+
+def calculate(
+    distance_km, weight_lbs,
+    is_ooa, ooa_type, ooa_km,
+    flags, wait_minutes, extra_stops,
+    apply_fuel, fuel_pct_override,
+    detail=True
+):
+    """Hashable-argument wrapper: flags may be a bitmask int or a legacy dict,
+    ooa_type an index into _OOA_TYPES or the legacy type string.
+
+    With detail=False, skips the breakdown dict and returns the lightweight
+    (zone, bracket, rate, base, total) tuple — or None when out of zone.
+    """
+    if isinstance(flags, dict):
+        flag_bits = 0
+        for i, name in enumerate(_ACC_NAMES):
+            if flags.get(name, False):
+                flag_bits |= 1 << i
+    else:
+        flag_bits = int(flags)
+    ooa_type_idx = _OOA_TYPES.index(ooa_type) if isinstance(ooa_type, str) else int(ooa_type)
+    vals = _calculate_cached(
+        distance_km, weight_lbs,
+        is_ooa, ooa_type_idx, ooa_km,
+        flag_bits, wait_minutes, extra_stops,
+        apply_fuel, fuel_pct_override,
+    )
+    if not detail:
+        # zone, bracket, rate, rounded base and total (positions in _BREAKDOWN_KEYS)
+        return None if vals is None else (vals[0], vals[1], vals[2], vals[3], vals[11])
+    if vals is None:
+        return {"error": "Distance exceeds Zone 5 (500 km) supported by this tariff."}
+    return dict(zip(_BREAKDOWN_KEYS, vals))
+
+# ---------------------- BATCH KERNEL ----------------------
+# Optional Numba-compiled kernel for bulk quoting (e.g. a CSV of shipments).
+# The app runs fine without numba; the kernel then executes as plain Python.
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+@njit(cache=True, parallel=True)
+def calculate_batch(dist, wt, ooa_km, ooa_type_idx, flag_bits, wait_min, extra_stops, fuel_pct):
+    """Quote n shipments at once; returns (base, acc, fuel, total) arrays.
+
+    flag_bits packs the accessorials in _ACC_NAMES order (bit 5 = direct
+    drive), fuel_pct is the resolved per-row decimal (0.0 when fuel is off),
+    and rows whose distance exceeds the last zone come back as NaN.
+    """
+    n = dist.shape[0]
+    base = np.empty(n, dtype=np.float64)
+    acc = np.empty(n, dtype=np.float64)
+    fuel = np.empty(n, dtype=np.float64)
+    total = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        z = 0
+        while z < 5 and dist[i] > _ZONE_UPPERS_ARR[z]:
+            z += 1
+        if z == 5:
+            base[i] = np.nan
+            acc[i] = np.nan
+            fuel[i] = np.nan
+            total[i] = np.nan
+            continue
+        b = 0
+        while b < 4 and wt[i] > _BRK_UPPERS_ARR[b]:
+            b += 1
+        bs = _RATE_MATRIX[b, z] * wt[i]
+        if bs < _MIN_CHARGE_ARR[z]:
+            bs = _MIN_CHARGE_ARR[z]
+        ooa = _OOA_RATE_ARR[ooa_type_idx[i]] * ooa_km[i]
+        a = 0.0
+        for j in range(6):
+            if flag_bits[i] & (1 << j):
+                a += _ACC_COSTS[j]
+        inc = (wait_min[i] - 30 + 14) // 15
+        if inc < 0:
+            inc = 0
+        a += (WAIT_RATE_HR / 4.0) * inc
+        extra = bs * extra_stops[i]
+        dd = _ACC_COSTS[5] if flag_bits[i] & 32 else 0.0
+        f = (bs + ooa + dd + extra) * fuel_pct[i]
+        base[i] = bs
+        acc[i] = a
+        fuel[i] = f
+        total[i] = bs + ooa + a + extra + f
+    return base, acc, fuel, total
+
+# Optional compiled scalar kernel (see calculator.pyx); absent unless built
+# with `python setup.py build_ext --inplace`.
+try:
+    import calculator as _cy
+except ImportError:
+    _cy = None
+else:
+    _cy.init_tables(_RATE_MATRIX, _MIN_CHARGE_ARR, _ACC_COSTS, _OOA_RATE_ARR,
+                    _ZONE_UPPERS_ARR, _BRK_UPPERS_ARR, WAIT_RATE_HR)
+
+def calculate_fast(distance_km, weight_lbs, ooa_type_idx, ooa_km,
+                   flags, wait_minutes, extra_stops, fuel_pct):
+    """Compiled single-shipment quote: (base, acc, fuel, total), NaN out of zone.
+
+    Maps the flags dict to the kernel's bitmask; requires the built Cython
+    extension (raises RuntimeError otherwise).
+    """
+    if _cy is None:
+        raise RuntimeError("calculator extension not built; run: python setup.py build_ext --inplace")
+    bits = 0
+    for i, name in enumerate(_ACC_NAMES):
+        if flags.get(name, False):
+            bits |= 1 << i
+    out = _cy._calc_scalar(distance_km, weight_lbs, ooa_type_idx, ooa_km,
+                           bits, wait_minutes, extra_stops, fuel_pct)
+    return tuple(out)
 
 # ---------------------- UI ----------------------
 st.title("📦 CEVA / NovaXpress Tariff Calculator")
@@ -151,20 +328,25 @@ if apply_fuel and use_default == "Override":
     fuel_override = st.number_input("Fuel Surcharge % (e.g., 12 for 12%)", min_value=0.0, value=15.0, step=0.5)
 
 if st.button("Calculate", type="primary"):
-    flags = {
-        "2 Man Service": two_man,
-        "Tailgate (over 200 lbs)": tailgate,
-        "Inside Delivery": inside,
-        "White Glove (residential)": white_glove,
-        "Skid Handbomb (lumper)": handbomb,
-        "Direct Drive (flat)": direct_drive,
-    }
-    res = calculate(
-        distance_km, weight_lbs,
-        is_ooa, ooa_type, ooa_km,
-        flags, wait_minutes, extra_stops,
-        apply_fuel, fuel_override if (apply_fuel and use_default=="Override") else None
-    )
+    # pack the toggles as a bitmask, _ACC_NAMES order
+    flag_bits = (two_man | tailgate << 1 | inside << 2
+                 | white_glove << 3 | handbomb << 4 | direct_drive << 5)
+    fuel_arg = fuel_override if (apply_fuel and use_default == "Override") else None
+    ooa_idx = _OOA_TYPES.index(ooa_type)
+    # Short-circuit repeat clicks with unchanged inputs via session state
+    key = (distance_km, weight_lbs, is_ooa, ooa_idx, ooa_km,
+           flag_bits, wait_minutes, extra_stops, apply_fuel, fuel_arg)
+    if st.session_state.get("_last_key") == key:
+        res = st.session_state["_last_res"]
+    else:
+        res = calculate(
+            distance_km, weight_lbs,
+            is_ooa, ooa_idx, ooa_km,
+            flag_bits, wait_minutes, extra_stops,
+            apply_fuel, fuel_arg
+        )
+        st.session_state["_last_key"] = key
+        st.session_state["_last_res"] = res
     if "error" in res:
         st.error(res["error"])
     else:
@@ -174,7 +356,7 @@ if st.button("Calculate", type="primary"):
             st.metric("Zone", res["Zone"])
             st.metric("Weight Bracket", res["Weight Bracket"])
             st.metric("Rate per lb", f'{res["Rate per lb"]:.3f}')
-            st.metric("Minimum Charge by Zone", f'${MIN_CHARGE[res["Zone"]]:,.2f}')
+            st.metric("Minimum Charge by Zone", f'${_MIN_BY_ZONE[res["Zone"]]:,.2f}')
         with right:
             st.metric("Base LTL", f'${res["Base LTL"]:.2f}')
             st.metric("Fuel % used", f'{res["Fuel % used"]*100:.2f}%')
@@ -183,61 +365,75 @@ if st.button("Calculate", type="primary"):
 
         st.write("---")
         st.subheader("Breakdown")
-        df = pd.DataFrame(
+        st.dataframe(
             {
-                "Component": [
-                    "Base LTL",
-                    "Out-of-Area charge",
-                    "Accessorials (non-fuel)",
-                    "Wait Time charge",
-                    "Extra Stops amount",
-                    "Fuel amount",
-                ],
-                "Amount ($)": [
-                    res["Base LTL"],
-                    res["OOA charge"],
-                    res["Accessorials (non-fuel)"],
-                    res["Wait Time charge"],
-                    res["Extra Stops amount"],
-                    res["Fuel amount"],
-                ],
-            }
+                "Component": _COMPONENTS,
+                "Amount ($)": np.fromiter(
+                    (res[k] for k in _COMPONENT_KEYS), dtype=np.float64, count=6
+                ),
+            },
+            use_container_width=True,
         )
-        st.dataframe(df, use_container_width=True)
 
 # ---------------------- TEST SCENARIOS ----------------------
-# with st.expander("Run example test scenarios"):
-#     tests = [
-#         ("Tiny Z1 (fuel default)", dict(distance_km=50, weight_lbs=20, is_ooa=False, ooa_type="FULL", ooa_km=0,
-#                                         flags={}, wait_minutes=0, extra_stops=0, apply_fuel=True, fuel_pct_override=None)),
-#         ("Tiny Z1 (fuel off)", dict(distance_km=50, weight_lbs=20, is_ooa=False, ooa_type="FULL", ooa_km=0,
-#                                     flags={}, wait_minutes=0, extra_stops=0, apply_fuel=False, fuel_pct_override=None)),
-#         ("1,600 lbs @120 km", dict(distance_km=120, weight_lbs=1600, is_ooa=False, ooa_type="FULL", ooa_km=0,
-#                                    flags={}, wait_minutes=0, extra_stops=0, apply_fuel=True, fuel_pct_override=None)),
-#         ("3,200 lbs @350 km + OOA FULL 60 + tailgate+white+wait50 + 1 extra",
-#          dict(distance_km=350, weight_lbs=3200, is_ooa=True, ooa_type="FULL", ooa_km=60,
-#               flags={"Tailgate (over 200 lbs)":True, "White Glove (residential)":True}, wait_minutes=50, extra_stops=1,
-#               apply_fuel=True, fuel_pct_override=None)),
-#         ("5,000 lbs @410 km + direct + 2-man + handbomb",
-#          dict(distance_km=410, weight_lbs=5000, is_ooa=False, ooa_type="FULL", ooa_km=0,
-#               flags={"Direct Drive (flat)":True, "2 Man Service":True, "Skid Handbomb (lumper)":True},
-#               wait_minutes=0, extra_stops=0, apply_fuel=True, fuel_pct_override=None)),
-#         ("800 lbs @480 km + OOA Backhaul Empty 120",
-#          dict(distance_km=480, weight_lbs=800, is_ooa=True, ooa_type="BACKHAUL EMPTY", ooa_km=120,
-#               flags={}, wait_minutes=0, extra_stops=0, apply_fuel=True, fuel_pct_override=None)),
-#         ("Fuel override 12%", dict(distance_km=50, weight_lbs=20, is_ooa=False, ooa_type="FULL", ooa_km=0,
-#                                    flags={}, wait_minutes=0, extra_stops=0, apply_fuel=True, fuel_pct_override=12)),
-#         ("Fuel override 0%", dict(distance_km=50, weight_lbs=20, is_ooa=False, ooa_type="FULL", ooa_km=0,
-#                                   flags={}, wait_minutes=0, extra_stops=0, apply_fuel=True, fuel_pct_override=0)),
-#     ]
-#     rows = []
-#     for name, kw in tests:
-#         res = calculate(**kw)
-#         res["Scenario"] = name
-#         rows.append(res)
-#     tdf = pd.DataFrame(rows)
-#     st.dataframe(tdf[
-#         ["Scenario","Zone","Weight Bracket","Rate per lb","Base LTL","OOA charge",
-#          "Accessorials (non-fuel)","Wait Time charge","Extra Stops amount",
-#          "Fuelable Subtotal","Fuel % used","Fuel amount","Grand Total"]
-#     ], use_container_width=True)
+@st.cache_data
+def _scenario_table():
+    """Evaluate the example scenarios in one vectorized pass (SoA layout)."""
+    names = [
+        "Tiny Z1 (fuel default)",
+        "Tiny Z1 (fuel off)",
+        "1,600 lbs @120 km",
+        "3,200 lbs @350 km + OOA FULL 60 + tailgate+white+wait50 + 1 extra",
+        "5,000 lbs @410 km + direct + 2-man + handbomb",
+        "800 lbs @480 km + OOA Backhaul Empty 120",
+        "Fuel override 12%",
+        "Fuel override 0%",
+    ]
+    dist = np.array([50, 50, 120, 350, 410, 480, 50, 50], dtype=np.float64)
+    wt = np.array([20, 20, 1600, 3200, 5000, 800, 20, 20], dtype=np.float64)
+    ooa_rate = np.array([0, 0, 0, OOA_RATE["FULL"], 0, OOA_RATE["BACKHAUL EMPTY"], 0, 0])
+    ooa_km = np.array([0, 0, 0, 60, 0, 120, 0, 0], dtype=np.float64)
+    # columns follow ACCESSORIALS order: 2-man, tailgate, inside, white glove, handbomb, direct drive
+    flag_mat = np.zeros((8, 6), dtype=np.float64)
+    flag_mat[3, [1, 3]] = 1.0   # tailgate + white glove
+    flag_mat[4, [0, 4, 5]] = 1.0  # 2-man + handbomb + direct drive
+    wait = np.array([0, 0, 0, 50, 0, 0, 0, 0], dtype=np.float64)
+    extra_stops = np.array([0, 0, 0, 1, 0, 0, 0, 0], dtype=np.float64)
+    # fuel percent per row, already resolved (NaN override -> default, fuel off -> 0)
+    fuel_pct = np.array([FUEL_DEFAULT, 0.0, FUEL_DEFAULT, FUEL_DEFAULT,
+                         FUEL_DEFAULT, FUEL_DEFAULT, 0.12, 0.0])
+
+    zone_idx = np.searchsorted(_ZONE_UPPERS, dist, side="left")
+    brk_idx = np.searchsorted(_BRK_UPPERS, wt, side="left")
+    rate = _RATE_MATRIX[brk_idx, zone_idx]
+    base = np.maximum(_MIN_CHARGE_ARR[zone_idx], rate * wt)
+
+    ooa_charge = ooa_rate * ooa_km
+    acc = flag_mat @ _ACC_COSTS
+    wait_charge = np.ceil((wait - 30) / 15).clip(min=0) * (WAIT_RATE_HR / 4.0)
+    extra_amt = base * extra_stops
+    direct_drive_flat = flag_mat[:, 5] * _ACC_COSTS[5]
+    fuelable = base + ooa_charge + direct_drive_flat + extra_amt
+    fuel_amt = fuelable * fuel_pct
+    total = base + ooa_charge + acc + wait_charge + extra_amt + fuel_amt
+
+    cols = {
+        "Scenario": names,
+        "Zone": zone_idx + 1,
+        "Weight Bracket": np.array(_BRK_NAMES)[brk_idx],
+        "Rate per lb": rate,
+        "Base LTL": np.round(base, 2),
+        "OOA charge": np.round(ooa_charge, 2),
+        "Accessorials (non-fuel)": np.round(acc, 2),
+        "Wait Time charge": np.round(wait_charge, 2),
+        "Extra Stops amount": np.round(extra_amt, 2),
+        "Fuelable Subtotal": np.round(fuelable, 2),
+        "Fuel % used": fuel_pct,
+        "Fuel amount": np.round(fuel_amt, 2),
+        "Grand Total": np.round(total, 2),
+    }
+    # st.dataframe takes the column dict directly; no pandas on our side
+    return {c: cols[c] for c in _SCENARIO_COLS}
+
+with st.expander("Run example test scenarios"):
+    st.dataframe(_scenario_table(), use_container_width=True)
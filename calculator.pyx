@@ -0,0 +1,72 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Compiled tariff kernel for high-QPS embedding (optional).
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+app.py picks the extension up automatically when present and keeps working
+without it. Tariff tables are injected from app.py via init_tables() so the
+tariff data stays defined in one place.
+"""
+import numpy as np
+
+cdef double[:, ::1] _RATE_MV
+cdef double[::1] _MIN_MV
+cdef double[::1] _ACC_MV
+cdef double[::1] _OOA_MV
+cdef double[::1] _ZONE_MV
+cdef double[::1] _BRK_MV
+cdef double _WAIT_QTR = 11.25
+
+
+def init_tables(rate_matrix, min_charge, acc_costs, ooa_rates,
+                zone_uppers, brk_uppers, double wait_rate_hr):
+    """Bind the tariff tables (NumPy float64 arrays) before first use."""
+    global _RATE_MV, _MIN_MV, _ACC_MV, _OOA_MV, _ZONE_MV, _BRK_MV, _WAIT_QTR
+    _RATE_MV = np.ascontiguousarray(rate_matrix, dtype=np.float64)
+    _MIN_MV = np.ascontiguousarray(min_charge, dtype=np.float64)
+    _ACC_MV = np.ascontiguousarray(acc_costs, dtype=np.float64)
+    _OOA_MV = np.ascontiguousarray(ooa_rates, dtype=np.float64)
+    _ZONE_MV = np.ascontiguousarray(zone_uppers, dtype=np.float64)
+    _BRK_MV = np.ascontiguousarray(brk_uppers, dtype=np.float64)
+    _WAIT_QTR = wait_rate_hr / 4.0
+
+
+cpdef double[::1] _calc_scalar(double dist, double wt, int ooa_type, double ooa_km,
+                               int flag_bits, int wait_min, int extra_stops,
+                               double fuel_pct):
+    """Quote one shipment; returns [base, acc, fuel, total] (NaN when out of zone)."""
+    cdef double[::1] out = np.empty(4, dtype=np.float64)
+    cdef int z = 0, b = 0, j, inc
+    cdef double base, ooa, acc, extra, dd, fuel
+
+    while z < 5 and dist > _ZONE_MV[z]:
+        z += 1
+    if z == 5:
+        out[0] = out[1] = out[2] = out[3] = np.nan
+        return out
+    while b < 4 and wt > _BRK_MV[b]:
+        b += 1
+
+    base = _RATE_MV[b, z] * wt
+    if base < _MIN_MV[z]:
+        base = _MIN_MV[z]
+    ooa = _OOA_MV[ooa_type] * ooa_km
+    acc = 0.0
+    for j in range(6):
+        if flag_bits & (1 << j):
+            acc += _ACC_MV[j]
+    inc = (wait_min - 30 + 14) // 15
+    if inc < 0:
+        inc = 0
+    acc += _WAIT_QTR * inc
+    extra = base * extra_stops
+    dd = _ACC_MV[5] if flag_bits & 32 else 0.0
+    fuel = (base + ooa + dd + extra) * fuel_pct
+
+    out[0] = base
+    out[1] = acc
+    out[2] = fuel
+    out[3] = base + ooa + acc + extra + fuel
+    return out